@@ -3,16 +3,28 @@ Kentucky Mugshot Scraper - Production Version
 Scrapes public arrest records from BustedNewspaper.com
 """
 
+import asyncio
+import httpx
+import ahocorasick
 import requests
-from bs4 import BeautifulSoup
-import pandas as pd
+import requests_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from selectolax.lexbor import LexborHTMLParser
 from datetime import datetime, timedelta
 import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import re
+import functools
 from pathlib import Path
+from dataclasses import dataclass, fields, astuple
+from urllib.parse import urlparse
 import logging
 import json
-import schedule
+import csv
+import pickle
+import hashlib
 from typing import List, Dict, Optional
 import argparse
 import sys
@@ -28,6 +40,132 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# CSS selectors matched natively by Lexbor (the `i` flag keeps class matching case-insensitive).
+# A single compound :is() selector returns each element once, even when its class matches
+# several words; a selector list would yield it once per matching member.
+ENTRY_SELECTOR = ':is(article, div):is({})'.format(
+    ', '.join(f'[class*="{word}" i]' for word in ('mugshot', 'booking', 'arrest'))
+)
+NAME_SELECTOR = ':is(h2, h3, a):is({})'.format(
+    ', '.join(f'[class*="{word}" i]' for word in ('name', 'title'))
+)
+
+# Precompiled patterns used while parsing pages
+_RE_AGE = re.compile(r'age\s+(\d+)', re.I)
+_RE_HEIGHT = re.compile(r"height\s+([\d'\"]+)", re.I)
+_RE_WEIGHT = re.compile(r'weight\s+(\d+)\s*lbs', re.I)
+_RE_HAIR = re.compile(r'hair\s+([A-Z]{3})', re.I)
+_RE_EYE = re.compile(r'eye\s+([A-Z]{3})', re.I)
+_RE_SEX = re.compile(r'sex\s+(Male|Female)')
+_RE_RACE = re.compile(r'race\s+([A-Z])\s+', re.I)
+_RE_BOOKED = re.compile(r'booked\s+([\d\-]+)', re.I)
+_RE_ARRESTED_BY = re.compile(r'arrested by\s+([A-Z\s]+)', re.I)
+_RE_BOND = re.compile(r'bond[:\s]+\$?([\d,]+)', re.I)
+_RE_CHARGES = re.compile(r'charges?[:\s]+(.+?)(?:bond|$)', re.I | re.DOTALL)
+
+DATE_FORMATS = ['%Y-%m-%d', '%m/%d/%Y', '%m-%d-%Y', '%Y/%m/%d']
+
+
+@dataclass(slots=True)
+class Record:
+    """A single arrest record; field order is the column order of saved CSVs"""
+    name: str = ''
+    booking_date: str = ''
+    charges: str = ''
+    age: str = ''
+    sex: str = ''
+    race: str = ''
+    height: str = ''
+    weight: str = ''
+    hair_color: str = ''
+    eye_color: str = ''
+    arrested_by: str = ''
+    bond_amount: str = ''
+    county: str = ''
+    mugshot_url: str = ''
+    scraped_at: str = ''
+
+
+# Column order for saved CSVs
+CSV_COLUMNS = [field.name for field in fields(Record)]
+
+# Pages of a county fetched ahead of the one being parsed
+PAGE_PREFETCH = 3
+
+# Retry policy shared by the requests session and the async httpx fetches
+MAX_RETRIES = 3
+RETRY_BACKOFF = 0.5
+RETRY_STATUSES = (502, 503, 504)
+
+# Names of the CSVs already written to a county's Parquet dataset, kept in its root
+# (the leading underscore keeps pyarrow from reading it as data)
+ARCHIVE_MANIFEST = '_archived_csvs.json'
+
+
+@functools.lru_cache(maxsize=2048)
+def _parse_date(date_str: str) -> Optional[datetime]:
+    """Parse date string; booking dates repeat heavily, so results are memoized"""
+    if not date_str:
+        return None
+    
+    # Zero-padded YYYY-MM-DD is by far the most common form; fromisoformat skips _strptime
+    # entirely. Anything else (e.g. unpadded "2024-1-5") falls through to DATE_FORMATS.
+    if len(date_str) == 10 and date_str[4] == '-' and date_str[7] == '-':
+        try:
+            return datetime.fromisoformat(date_str)
+        except ValueError:
+            pass
+    
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(date_str, fmt)
+        except ValueError:
+            continue
+    return None
+
+
+def _hash_record_id(name: str, booking_date: str) -> bytes:
+    """8-byte BLAKE2 digest identifying a person/booking pair"""
+    key = f"{name}|{booking_date}".lower().encode()
+    return hashlib.blake2b(key, digest_size=8).digest()
+
+
+@functools.lru_cache(maxsize=None)
+def _parquet_schema():
+    """Schema of the Parquet archive: every field is scraped text"""
+    import pyarrow as pa
+    return pa.schema([(col, pa.string()) for col in CSV_COLUMNS])
+
+
+class _RateLimiter:
+    """Token bucket shared by fetch threads; a used token is refilled after `interval` seconds"""
+    
+    def __init__(self, interval: float = 1.0, burst: int = 1):
+        self.interval = interval
+        self._tokens = threading.Semaphore(burst)
+    
+    def acquire(self):
+        """Block until another request may be sent"""
+        self._tokens.acquire()
+        refill = threading.Timer(self.interval, self._tokens.release)
+        refill.daemon = True
+        refill.start()
+
+
+class _AsyncRateLimiter:
+    """Spaces request starts `interval` seconds apart without waiting for earlier responses"""
+    
+    def __init__(self, interval: float = 1.0):
+        self.interval = interval
+        self._next_start = 0.0
+    
+    async def acquire(self):
+        """Wait for this request's start slot"""
+        now = asyncio.get_running_loop().time()
+        start = max(now, self._next_start)
+        self._next_start = start + self.interval
+        await asyncio.sleep(start - now)
+
 
 class KentuckyMugshotScraper:
     """
@@ -39,6 +177,9 @@ class KentuckyMugshotScraper:
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
         
+        # Append-only Parquet archive, one dataset per county
+        self.dataset_dir = self.output_dir / 'parquet'
+        
         # Cache directory
         self.cache_dir = Path('scraper_cache')
         self.cache_dir.mkdir(exist_ok=True)
@@ -52,6 +193,36 @@ class KentuckyMugshotScraper:
             'Upgrade-Insecure-Requests': '1'
         }
         
+        # Persistent session so page fetches reuse the keep-alive connection;
+        # unchanged pages are served from an on-disk HTTP cache. Only scrape_county
+        # (--county runs) uses this session: --all and scheduled runs over every
+        # county go through the async httpx client, which shares the retry policy
+        # but not the cache
+        self.session = requests_cache.CachedSession(
+            self.cache_dir / 'http_cache',
+            backend='sqlite',
+            expire_after=600,
+            cache_control=True,
+            stale_if_error=True
+        )
+        self.session.headers.update(self.headers)
+        self.session.mount('https://', HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=20,
+            max_retries=Retry(total=MAX_RETRIES, backoff_factor=RETRY_BACKOFF, status_forcelist=RETRY_STATUSES)
+        ))
+        
+        # Polite limit of ~1 request/second to the site
+        self.rate_limiter = _RateLimiter(interval=1.0)
+        
+        # Per-host rate limits for the async scraper, at the same ~1 request/second
+        self._host_limits: Dict[str, _AsyncRateLimiter] = {}
+        
+        # Event loop and HTTP/2 client for the async scraper, created on first use and
+        # kept for the scraper's lifetime so scheduled runs reuse the same connection
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._http_client: Optional[httpx.AsyncClient] = None
+        
         # County mappings
         self.counties = {
             'nelson': 'nelson-county',
@@ -67,39 +238,57 @@ class KentuckyMugshotScraper:
     
     def load_cache(self, county_name: str) -> set:
         """Load previously scraped record IDs"""
+        cache_file = self.cache_dir / f"{county_name}_cache.pkl"
+        
+        if not cache_file.exists():
+            return self._load_legacy_cache(county_name)
+        
+        try:
+            with open(cache_file, 'rb') as f:
+                return pickle.load(f)['record_ids']
+        except Exception as e:
+            logger.warning(f"Error loading cache: {e}")
+        return set()
+    
+    def _load_legacy_cache(self, county_name: str) -> set:
+        """Convert IDs from the old JSON cache ("name_yyyy-mm-dd" strings) to hashed IDs"""
         cache_file = self.cache_dir / f"{county_name}_cache.json"
         
         if cache_file.exists():
             try:
                 with open(cache_file, 'r') as f:
                     data = json.load(f)
-                    return set(data.get('record_ids', []))
+                record_ids = set()
+                for old_id in data.get('record_ids', []):
+                    name, _, booking_date = old_id.rpartition('_')
+                    record_ids.add(_hash_record_id(name.replace('_', ' '), booking_date))
+                return record_ids
             except Exception as e:
-                logger.warning(f"Error loading cache: {e}")
+                logger.warning(f"Error loading legacy cache: {e}")
         return set()
     
     def save_cache(self, county_name: str, record_ids: set):
         """Save scraped record IDs to cache"""
-        cache_file = self.cache_dir / f"{county_name}_cache.json"
+        cache_file = self.cache_dir / f"{county_name}_cache.pkl"
         
         try:
-            with open(cache_file, 'w') as f:
-                json.dump({
-                    'record_ids': list(record_ids),
+            with open(cache_file, 'wb') as f:
+                pickle.dump({
+                    'record_ids': record_ids,
                     'last_updated': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                }, f, indent=2)
+                }, f, protocol=5)
         except Exception as e:
             logger.warning(f"Error saving cache: {e}")
     
-    def generate_record_id(self, record: Dict) -> str:
+    def generate_record_id(self, record: Record) -> bytes:
         """Generate unique ID for a record"""
-        return f"{record['name']}_{record['booking_date']}".lower().replace(' ', '_')
+        return _hash_record_id(record.name, record.booking_date)
     
     def scrape_county(self, county_name: str, max_pages: int = 5, 
                      date_from: Optional[datetime] = None, 
                      date_to: Optional[datetime] = None,
                      charge_keywords: Optional[List[str]] = None,
-                     skip_duplicates: bool = True) -> List[Dict]:
+                     skip_duplicates: bool = True) -> List[Record]:
         """
         Scrape mugshot data for a specific county
         """
@@ -111,7 +300,10 @@ class KentuckyMugshotScraper:
         county_slug = self.counties[county_name.lower()]
         url = f"{self.base_url}/{county_slug}/"
         
-        logger.info(f"Starting scrape for {county_name.title()} County...")
+        county_title = county_name.title()
+        scraped_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        
+        logger.info(f"Starting scrape for {county_title} County...")
         if date_from:
             logger.info(f"Filtering from: {date_from.strftime('%Y-%m-%d')}")
         if date_to:
@@ -119,6 +311,112 @@ class KentuckyMugshotScraper:
         if charge_keywords:
             logger.info(f"Filtering charges: {', '.join(charge_keywords)}")
         
+        charge_matcher = self._build_charge_matcher(charge_keywords)
+        
+        all_records = []
+        new_record_ids = set()
+        
+        page_urls = [url] + [f"{url}page/{page}/" for page in range(2, max_pages + 1)]
+        futures = {}
+        
+        with ThreadPoolExecutor(max_workers=PAGE_PREFETCH) as executor:
+            for page in range(1, max_pages + 1):
+                # Keep the next few pages in flight while this one is parsed
+                for ahead in range(page, min(page + PAGE_PREFETCH, max_pages + 1)):
+                    if ahead not in futures:
+                        futures[ahead] = executor.submit(self._fetch_page, page_urls[ahead - 1])
+                
+                try:
+                    logger.info(f"Scraping page {page}")
+                    response = futures.pop(page).result()
+                    
+                    records = self._parse_content(response.content, county_title, scraped_at)
+                    
+                    if not records:
+                        logger.info(f"No more records on page {page}")
+                        break
+                    
+                    filtered_records = self._filter_records(
+                        records, cached_ids, new_record_ids, date_from, date_to, charge_matcher
+                    )
+                    
+                    all_records.extend(filtered_records)
+                    
+                    logger.info(f"Found {len(filtered_records)} new records on page {page}")
+                    
+                except requests.exceptions.RequestException as e:
+                    logger.error(f"Error fetching page {page}: {e}")
+                    break
+                except Exception as e:
+                    logger.error(f"Error parsing page {page}: {e}")
+                    continue
+            
+            for future in futures.values():
+                future.cancel()
+        
+        if skip_duplicates and new_record_ids:
+            cached_ids.update(new_record_ids)
+            self.save_cache(county_name, cached_ids)
+        
+        logger.info(f"Total new records for {county_name}: {len(all_records)}")
+        return all_records
+    
+    def _fetch_page(self, page_url: str) -> requests.Response:
+        """Fetch a single page; only requests that reach the site wait for the rate limiter"""
+        response = self.session.get(page_url, only_if_cached=True, timeout=30)
+        
+        # requests-cache answers 504 when the page isn't cached; with stale_if_error it
+        # hands back expired entries too, which still need a real (revalidating) request
+        if response.status_code == 504 or getattr(response, 'is_expired', False):
+            self.rate_limiter.acquire()
+            response = self.session.get(page_url, timeout=30)
+        
+        response.raise_for_status()
+        return response
+    
+    async def _fetch(self, client: httpx.AsyncClient, url: str) -> bytes:
+        """Fetch a page body; only request starts are spaced out, so responses overlap on the connection"""
+        host = urlparse(url).netloc
+        host_limit = self._host_limits.setdefault(host, _AsyncRateLimiter(interval=1.0))
+        
+        # Same retry policy as the session's HTTPAdapter: connection errors and gateway errors
+        for attempt in range(MAX_RETRIES + 1):
+            await host_limit.acquire()
+            try:
+                response = await client.get(url)
+            except httpx.TransportError:
+                if attempt == MAX_RETRIES:
+                    raise
+            else:
+                if response.status_code not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                    response.raise_for_status()
+                    return response.content
+            await asyncio.sleep(RETRY_BACKOFF * 2 ** attempt)
+    
+    async def scrape_county_async(self, client: httpx.AsyncClient, county_name: str,
+                                  max_pages: int = 5,
+                                  date_from: Optional[datetime] = None,
+                                  date_to: Optional[datetime] = None,
+                                  charge_keywords: Optional[List[str]] = None,
+                                  skip_duplicates: bool = True) -> List[Record]:
+        """
+        Async variant of scrape_county; pages are fetched in order, parsing runs in a worker thread
+        """
+        if county_name.lower() not in self.counties:
+            logger.error(f"County '{county_name}' not supported")
+            return []
+        
+        cached_ids = self.load_cache(county_name) if skip_duplicates else set()
+        county_slug = self.counties[county_name.lower()]
+        url = f"{self.base_url}/{county_slug}/"
+        
+        county_title = county_name.title()
+        scraped_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        
+        logger.info(f"Starting scrape for {county_title} County...")
+        
+        charge_matcher = self._build_charge_matcher(charge_keywords)
+        
         all_records = []
         new_record_ids = set()
         
@@ -126,34 +424,28 @@ class KentuckyMugshotScraper:
             page_url = url if page == 1 else f"{url}page/{page}/"
             
             try:
-                logger.info(f"Scraping page {page}")
-                response = requests.get(page_url, headers=self.headers, timeout=30)
-                response.raise_for_status()
-                
-                soup = BeautifulSoup(response.content, 'html.parser')
-                records = self._parse_page(soup, county_name)
+                logger.info(f"Scraping {county_name} page {page}")
+                content = await self._fetch(client, page_url)
+                records = await asyncio.to_thread(self._parse_content, content, county_title, scraped_at)
                 
                 if not records:
-                    logger.info(f"No more records on page {page}")
+                    logger.info(f"No more records for {county_name} on page {page}")
                     break
                 
                 filtered_records = self._filter_records(
-                    records, cached_ids, date_from, date_to, charge_keywords
+                    records, cached_ids, new_record_ids, date_from, date_to, charge_matcher
                 )
                 
                 all_records.extend(filtered_records)
                 
-                for record in filtered_records:
-                    new_record_ids.add(self.generate_record_id(record))
+                logger.info(f"Found {len(filtered_records)} new records for {county_name} on page {page}")
+                await asyncio.sleep(2)
                 
-                logger.info(f"Found {len(filtered_records)} new records on page {page}")
-                time.sleep(2)
-                
-            except requests.exceptions.RequestException as e:
-                logger.error(f"Error fetching page {page}: {e}")
+            except httpx.HTTPError as e:
+                logger.error(f"Error fetching {county_name} page {page}: {e}")
                 break
             except Exception as e:
-                logger.error(f"Error parsing page {page}: {e}")
+                logger.error(f"Error parsing {county_name} page {page}: {e}")
                 continue
         
         if skip_duplicates and new_record_ids:
@@ -163,60 +455,63 @@ class KentuckyMugshotScraper:
         logger.info(f"Total new records for {county_name}: {len(all_records)}")
         return all_records
     
-    def _filter_records(self, records: List[Dict], cached_ids: set,
+    def _build_charge_matcher(self, charge_keywords: Optional[List[str]]) -> Optional[ahocorasick.Automaton]:
+        """Compile charge keywords into one Aho-Corasick automaton; empty keywords are ignored"""
+        keywords = [kw.lower() for kw in charge_keywords or [] if kw]
+        if not keywords:
+            return None
+        
+        automaton = ahocorasick.Automaton()
+        for kw in keywords:
+            automaton.add_word(kw, True)
+        automaton.make_automaton()
+        return automaton
+    
+    def _filter_records(self, records: List[Record], cached_ids: set, seen_ids: set,
                        date_from: Optional[datetime], date_to: Optional[datetime],
-                       charge_keywords: Optional[List[str]]) -> List[Dict]:
-        """Apply filters to records"""
+                       charge_matcher: Optional[ahocorasick.Automaton]) -> List[Record]:
+        """Apply filters to records; IDs of kept records are added to seen_ids"""
         filtered = []
         
         for record in records:
             record_id = self.generate_record_id(record)
-            if record_id in cached_ids:
+            if record_id in seen_ids or record_id in cached_ids:
                 continue
             
             if date_from or date_to:
-                booking_date = self._parse_date(record['booking_date'])
+                booking_date = _parse_date(record.booking_date)
                 if booking_date:
                     if date_from and booking_date < date_from:
                         continue
                     if date_to and booking_date > date_to:
                         continue
             
-            if charge_keywords and record['charges']:
-                charges_lower = record['charges'].lower()
-                if not any(kw.lower() in charges_lower for kw in charge_keywords):
+            if charge_matcher is not None and record.charges:
+                charges_lower = record.charges.lower()
+                if next(charge_matcher.iter(charges_lower), None) is None:
                     continue
             
+            seen_ids.add(record_id)
             filtered.append(record)
         
         return filtered
     
-    def _parse_date(self, date_str: str) -> Optional[datetime]:
-        """Parse date string"""
-        if not date_str:
-            return None
-        
-        formats = ['%Y-%m-%d', '%m/%d/%Y', '%m-%d-%Y', '%Y/%m/%d']
-        
-        for fmt in formats:
-            try:
-                return datetime.strptime(date_str, fmt)
-            except ValueError:
-                continue
-        return None
+    def _parse_content(self, content, county_title, scraped_at):
+        """Build the DOM for a fetched page and parse its records"""
+        return self._parse_page(LexborHTMLParser(content), county_title, scraped_at)
     
-    def _parse_page(self, soup, county_name):
+    def _parse_page(self, tree, county_title, scraped_at):
         """Parse mugshot records from page"""
         records = []
         
-        entries = soup.find_all(['article', 'div'], class_=re.compile(r'(mugshot|booking|arrest)', re.I))
+        entries = tree.css(ENTRY_SELECTOR)
         
         if not entries:
-            entries = soup.find_all('div', class_='post')
+            entries = tree.css('div.post')
         
         for entry in entries:
             try:
-                record = self._extract_record_data(entry, county_name)
+                record = self._extract_record_data(entry, county_title, scraped_at)
                 if record:
                     records.append(record)
             except Exception as e:
@@ -225,66 +520,49 @@ class KentuckyMugshotScraper:
         
         return records
     
-    def _extract_record_data(self, entry, county_name):
-        """Extract data from single record"""
-        record = {
-            'county': county_name.title(),
-            'name': '',
-            'age': '',
-            'height': '',
-            'weight': '',
-            'hair_color': '',
-            'eye_color': '',
-            'sex': '',
-            'race': '',
-            'booking_date': '',
-            'arrested_by': '',
-            'charges': '',
-            'bond_amount': '',
-            'mugshot_url': '',
-            'scraped_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        }
+    def _extract_record_data(self, entry, county_title, scraped_at):
+        """Extract data from single record; county_title and scraped_at are shared by the whole scrape"""
+        record = Record(county=county_title, scraped_at=scraped_at)
         
-        name_elem = entry.find(['h2', 'h3', 'a'], class_=re.compile(r'name|title', re.I))
+        name_elem = entry.css_first(NAME_SELECTOR)
         if name_elem:
-            record['name'] = name_elem.get_text(strip=True)
+            record.name = name_elem.text(strip=True)
         
-        img_elem = entry.find('img')
-        if img_elem and img_elem.get('src'):
-            record['mugshot_url'] = img_elem.get('src')
+        img_elem = entry.css_first('img')
+        if img_elem and img_elem.attributes.get('src'):
+            record.mugshot_url = img_elem.attributes.get('src')
         
-        text_content = entry.get_text()
+        text_content = entry.text()
         
-        record['age'] = self._extract_pattern(text_content, r'age\s+(\d+)')
-        record['height'] = self._extract_pattern(text_content, r"height\s+([\d'\"]+)")
-        record['weight'] = self._extract_pattern(text_content, r'weight\s+(\d+)\s*lbs')
-        record['hair_color'] = self._extract_pattern(text_content, r'hair\s+([A-Z]{3})')
-        record['eye_color'] = self._extract_pattern(text_content, r'eye\s+([A-Z]{3})')
-        record['sex'] = self._extract_pattern(text_content, r'sex\s+(Male|Female)', case_sensitive=True)
-        record['race'] = self._extract_pattern(text_content, r'race\s+([A-Z])\s+')
+        record.age = self._extract_pattern(text_content, _RE_AGE)
+        record.height = self._extract_pattern(text_content, _RE_HEIGHT)
+        record.weight = self._extract_pattern(text_content, _RE_WEIGHT)
+        record.hair_color = self._extract_pattern(text_content, _RE_HAIR)
+        record.eye_color = self._extract_pattern(text_content, _RE_EYE)
+        record.sex = self._extract_pattern(text_content, _RE_SEX)
+        record.race = self._extract_pattern(text_content, _RE_RACE)
         
-        booking_date = self._extract_pattern(text_content, r'booked\s+([\d\-]+)')
+        booking_date = self._extract_pattern(text_content, _RE_BOOKED)
         if booking_date:
-            record['booking_date'] = booking_date
+            record.booking_date = booking_date
         
-        arrested_by = self._extract_pattern(text_content, r'arrested by\s+([A-Z\s]+)', multiword=True)
+        arrested_by = self._extract_pattern(text_content, _RE_ARRESTED_BY, multiword=True)
         if arrested_by:
-            record['arrested_by'] = arrested_by
+            record.arrested_by = arrested_by
         
-        bond = self._extract_pattern(text_content, r'bond[:\s]+\$?([\d,]+)')
+        bond = self._extract_pattern(text_content, _RE_BOND)
         if bond:
-            record['bond_amount'] = bond
+            record.bond_amount = bond
         
-        charges_match = re.search(r'charges?[:\s]+(.+?)(?:bond|$)', text_content, re.I | re.DOTALL)
+        charges_match = _RE_CHARGES.search(text_content)
         if charges_match:
-            record['charges'] = charges_match.group(1).strip()
+            record.charges = charges_match.group(1).strip()
         
-        return record if record['name'] else None
+        return record if record.name else None
     
-    def _extract_pattern(self, text, pattern, case_sensitive=False, multiword=False):
-        """Extract data using regex"""
-        flags = 0 if case_sensitive else re.I
-        match = re.search(pattern, text, flags)
+    def _extract_pattern(self, text, pattern, multiword=False):
+        """Extract data using a precompiled regex"""
+        match = pattern.search(text)
         
         if match:
             result = match.group(1).strip()
@@ -307,39 +585,155 @@ class KentuckyMugshotScraper:
         
         filepath = self.output_dir / filename
         
-        df = pd.DataFrame(records)
+        # Must run before this CSV is written so its records aren't imported twice
+        try:
+            self._import_csvs_to_dataset(county_name)
+        except Exception as e:
+            logger.warning(f"Error importing CSVs into Parquet dataset: {e}")
         
-        column_order = ['name', 'booking_date', 'charges', 'age', 'sex', 'race',
-                       'height', 'weight', 'hair_color', 'eye_color', 
-                       'arrested_by', 'bond_amount', 'county', 'mugshot_url', 'scraped_at']
+        with open(filepath, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(CSV_COLUMNS)
+            writer.writerows(astuple(record) for record in records)
         
-        column_order = [col for col in column_order if col in df.columns]
-        df = df[column_order]
+        logger.info(f"Saved {len(records)} records to {filepath}")
         
-        df.to_csv(filepath, index=False)
+        try:
+            self.append_to_dataset(records, county_name, filepath.name)
+        except Exception as e:
+            logger.warning(f"Error appending to Parquet dataset: {e}")
         
-        logger.info(f"Saved {len(records)} records to {filepath}")
         return filepath
     
-    def scrape_all_counties(self, max_pages=3, **filter_kwargs):
-        """Scrape all counties"""
-        results = {}
+    def append_to_dataset(self, records, county_name, csv_name):
+        """Append records saved to csv_name to the county's Parquet dataset"""
+        import pyarrow as pa
         
-        for county_name in self.counties.keys():
-            logger.info(f"\n{'='*60}")
-            logger.info(f"Processing {county_name.title()} County")
-            logger.info(f"{'='*60}\n")
-            
-            records = self.scrape_county(county_name, max_pages, **filter_kwargs)
-            results[county_name] = records
-            
+        table = pa.table(
+            {col: [getattr(record, col) for record in records] for col in CSV_COLUMNS},
+            schema=_parquet_schema()
+        )
+        self._write_dataset(table, county_name, csv_name)
+    
+    def _import_csvs_to_dataset(self, county_name):
+        """Write the county's CSVs that aren't in its Parquet dataset yet"""
+        import pyarrow as pa
+        
+        csv_files = sorted(self.output_dir.glob(f"{county_name.lower()}_mugshots_*.csv"))
+        county_root = self.dataset_dir / county_name.lower()
+        
+        # Datasets started before the manifest existed already hold every CSV saved so far
+        if county_root.exists() and not (county_root / ARCHIVE_MANIFEST).exists():
+            self._mark_archived(county_name, *(csv_file.name for csv_file in csv_files))
+            return
+        
+        archived = self._load_archived_csvs(county_name)
+        for csv_file in csv_files:
+            if csv_file.name in archived:
+                continue
+            with open(csv_file, newline='', encoding='utf-8') as f:
+                rows = [{col: row.get(col) or '' for col in CSV_COLUMNS} for row in csv.DictReader(f)]
+            if rows:
+                self._write_dataset(pa.Table.from_pylist(rows, schema=_parquet_schema()), county_name, csv_file.name)
+                logger.info(f"Imported {len(rows)} records from {csv_file} into Parquet dataset")
+            else:
+                self._mark_archived(county_name, csv_file.name)
+    
+    def _write_dataset(self, table, county_name, csv_name):
+        """Write a CSV's records to the county's Parquet dataset, partitioned by booking date"""
+        import pyarrow.parquet as pq
+        
+        # Start the manifest with the dataset so a failed first write isn't taken for an old dataset
+        if not (self.dataset_dir / county_name.lower()).exists():
+            self._mark_archived(county_name)
+        
+        # Files are named after the CSV, so writing one again after a failure overwrites
+        # its partial output instead of duplicating it
+        pq.write_to_dataset(
+            table,
+            root_path=self.dataset_dir / county_name.lower(),
+            partition_cols=['booking_date'],
+            basename_template=f"{Path(csv_name).stem}-{{i}}.parquet",
+            existing_data_behavior='overwrite_or_ignore',
+            compression='zstd'
+        )
+        self._mark_archived(county_name, csv_name)
+    
+    def _load_archived_csvs(self, county_name) -> set:
+        """Names of the county's CSVs already written to its Parquet dataset"""
+        manifest = self.dataset_dir / county_name.lower() / ARCHIVE_MANIFEST
+        
+        if not manifest.exists():
+            return set()
+        
+        try:
+            with open(manifest, 'r') as f:
+                return set(json.load(f))
+        except Exception as e:
+            logger.warning(f"Error loading {manifest}: {e}")
+        return set()
+    
+    def _mark_archived(self, county_name, *csv_names):
+        """Record CSVs as written to the county's Parquet dataset"""
+        county_root = self.dataset_dir / county_name.lower()
+        archived = self._load_archived_csvs(county_name)
+        archived.update(csv_names)
+        
+        county_root.mkdir(parents=True, exist_ok=True)
+        with open(county_root / ARCHIVE_MANIFEST, 'w') as f:
+            json.dump(sorted(archived), f, indent=2)
+    
+    async def scrape_all_counties_async(self, max_pages=3, **filter_kwargs):
+        """Scrape all counties concurrently on one event loop"""
+        self._host_limits = {}
+        client = self._get_http_client()
+        
+        county_records = await asyncio.gather(*(
+            self.scrape_county_async(client, county_name, max_pages, **filter_kwargs)
+            for county_name in self.counties
+        ))
+        
+        results = dict(zip(self.counties, county_records))
+        
+        for county_name, records in results.items():
             if records:
                 self.save_to_csv(records, county_name)
-            
-            time.sleep(3)
         
         return results
     
+    def scrape_all_counties(self, max_pages=3, **filter_kwargs):
+        """Scrape all counties; these requests go through httpx, so they bypass the requests-cache"""
+        return self._run_async(self.scrape_all_counties_async(max_pages, **filter_kwargs))
+    
+    def _run_async(self, coro):
+        """Run a coroutine on the scraper's long-lived event loop"""
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+        return self._loop.run_until_complete(coro)
+    
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Shared HTTP/2 client; all county requests multiplex over its connections"""
+        if self._http_client is None:
+            # HTTP/2 forbids connection-specific headers such as Connection: keep-alive
+            headers = {k: v for k, v in self.headers.items() if k.lower() != 'connection'}
+            self._http_client = httpx.AsyncClient(
+                http2=True,
+                headers=headers,
+                limits=httpx.Limits(max_keepalive_connections=4, max_connections=8),
+                timeout=30.0
+            )
+        return self._http_client
+    
+    def close(self):
+        """Close the HTTP clients and the async scraper's event loop"""
+        if self._http_client is not None:
+            self._run_async(self._http_client.aclose())
+            self._http_client = None
+        if self._loop is not None:
+            self._loop.close()
+            self._loop = None
+        self.session.close()
+    
     def generate_summary_report(self, results):
         """Generate summary report"""
         timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
@@ -366,25 +760,58 @@ class KentuckyMugshotScraper:
         return report
     
     def search_by_name(self, name: str, county: Optional[str] = None) -> List[Dict]:
-        """Search saved CSVs for name"""
+        """Search saved records for name"""
         results = []
         name_lower = name.lower()
         
         if county:
             csv_files = list(self.output_dir.glob(f"{county.lower()}_mugshots_*.csv"))
+            dataset_roots = [self.dataset_dir / county.lower()]
         else:
             csv_files = list(self.output_dir.glob("*_mugshots_*.csv"))
+            dataset_roots = list(self.dataset_dir.iterdir()) if self.dataset_dir.exists() else []
         
-        for csv_file in csv_files:
-            try:
-                df = pd.read_csv(csv_file)
-                matches = df[df['name'].str.lower().str.contains(name_lower, na=False)]
-                results.extend(matches.to_dict('records'))
-            except Exception as e:
-                logger.warning(f"Error searching {csv_file}: {e}")
+        archived = set()
+        for dataset_root in dataset_roots:
+            if dataset_root.is_dir():
+                archived |= self._load_archived_csvs(dataset_root.name)
+                results.extend(self._search_dataset(dataset_root, name))
+        
+        # CSVs not in a dataset yet (no archive for the county, or a failed write) are read directly
+        csv_files = [csv_file for csv_file in csv_files if csv_file.name not in archived]
+        
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            for matches in executor.map(lambda csv_file: self._search_csv(csv_file, name_lower), csv_files):
+                results.extend(matches)
         
         return results
     
+    def _search_dataset(self, dataset_root: Path, name: str) -> List[Dict]:
+        """Scan the Parquet dataset with the name filter pushed into the scan"""
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        import pyarrow.dataset as ds
+        
+        try:
+            partitioning = ds.partitioning(pa.schema([('booking_date', pa.string())]), flavor='hive')
+            dataset = ds.dataset(dataset_root, schema=_parquet_schema(), format='parquet',
+                                 partitioning=partitioning)
+            name_filter = pc.match_substring(ds.field('name'), name, ignore_case=True)
+            return dataset.to_table(filter=name_filter).to_pylist()
+        except Exception as e:
+            logger.warning(f"Error searching {dataset_root}: {e}")
+            return []
+    
+    def _search_csv(self, csv_file: Path, name_lower: str) -> List[Dict]:
+        """Stream one CSV and return rows whose name contains name_lower"""
+        try:
+            with open(csv_file, newline='', encoding='utf-8') as f:
+                reader = csv.DictReader(f)
+                return [row for row in reader if name_lower in row['name'].lower()]
+        except Exception as e:
+            logger.warning(f"Error searching {csv_file}: {e}")
+            return []
+    
     def scheduled_scrape(self, counties: List[str] = None, max_pages: int = 3):
         """Run scheduled scrape"""
         logger.info("Running scheduled scrape...")
@@ -407,6 +834,8 @@ def setup_scheduler(scraper: KentuckyMugshotScraper,
                     times: List[str] = ['09:00', '12:00', '15:00', '18:00'],
                     counties: List[str] = None):
     """Setup scheduled scraping"""
+    import schedule
+    
     for run_time in times:
         schedule.every().day.at(run_time).do(
             scraper.scheduled_scrape, 
@@ -458,6 +887,7 @@ def main():
     if args.schedule:
         counties = [args.county] if args.county else None
         setup_scheduler(scraper, args.times, counties)
+        scraper.close()
         return
     
     if args.county:
@@ -482,6 +912,7 @@ def main():
             charge_keywords=args.charges
         )
         scraper.generate_summary_report(results)
+        scraper.close()
     
     else:
         parser.print_help()
@@ -0,0 +1,47 @@
+import importlib
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+@pytest.fixture
+def scraper(tmp_path, monkeypatch):
+    """Import the module with its log, cache and output files kept under tmp_path"""
+    monkeypatch.chdir(tmp_path)
+    module = importlib.import_module('scraper')
+    return module.KentuckyMugshotScraper(output_dir=tmp_path / 'mugshot_data')
+
+
+def test_multi_word_class_entry_parsed_once(scraper):
+    page = b'''<html><body>
+    <div class="mugshot-booking arrest-card"><h2 class="entry-title">John Doe</h2>
+    <p>Age 34 Booked 2024-01-05 Charges: theft</p></div>
+    <article class="Booking"><h3 class="Name">Jane Roe</h3>
+    <p>Age 29 Booked 2024-01-06 Charges: DUI</p></article>
+    </body></html>'''
+
+    records = scraper._parse_content(page, 'Nelson', '2024-01-07 00:00:00')
+
+    assert [record.name for record in records] == ['John Doe', 'Jane Roe']
+
+
+def test_csv_missing_from_dataset_still_searched(scraper, monkeypatch):
+    def fail_write(*args):
+        raise OSError('disk full')
+
+    Record = importlib.import_module('scraper').Record
+    scraper.save_to_csv([Record(name='John Doe', booking_date='2024-01-05')], 'nelson', include_timestamp=False)
+    monkeypatch.setattr(scraper, '_write_dataset', fail_write)
+    scraper.save_to_csv([Record(name='Jane Doe', booking_date='2024-01-06')], 'nelson')
+
+    assert sorted(row['name'] for row in scraper.search_by_name('doe')) == ['Jane Doe', 'John Doe']
+
+
+def test_empty_charge_keywords_ignored(scraper):
+    assert scraper._build_charge_matcher(['']) is None
+
+    matcher = scraper._build_charge_matcher(['', 'Theft'])
+    assert [value for _, value in matcher.iter('petty theft')] == [True]